@@ -108,11 +108,49 @@ options:
 
         type: dict
 
+    operations:
+        description:
+            -   list of operations to be performed in a single task
+
+            -   each entry is a dict with operation, entity_type, entity and args keys
+
+            -   entries reuse the logged in Commcell session, amortising the login cost
+
+        required: false
+
+        default: []
+
+        type: list
+
+    concurrency:
+        description:
+            -   number of operations from the operations list to run in parallel
+
+            -   operations are I/O bound REST calls, so independent ones overlap well
+
+        required: false
+
+        default: 1
+
+        type: int
+
+    token_cache:
+        description:
+            -   whether to persist the authtoken to a mode 0600 on-disk cache
+
+            -   lets sequential tasks skip the REST login entirely
+
+        required: false
+
+        default: true
+
+        type: bool
+
 requirements:
 
     - Ansible
 
-    - Python 2.7 or above
+    - Python 3.10 or above
 
     - CVPySDK
 
@@ -178,6 +216,31 @@ EXAMPLES = '''
             }
         register: restore_status
 
+**Run multiple operations in one task:**
+
+      - name: Get properties of several subclients
+        commvault:
+            operation: "batch"
+            commcell: "{{ commcell }}"
+            operations:
+                - operation: "description"
+                  entity_type: subclient
+                  entity: {
+                      client: "client name",
+                      agent: "file system",
+                      backupset: "defaultbackupset",
+                      subclient: "default"
+                  }
+                - operation: "description"
+                  entity_type: subclient
+                  entity: {
+                      client: "client name",
+                      agent: "file system",
+                      backupset: "defaultbackupset",
+                      subclient: "second subclient"
+                  }
+        register: descriptions
+
 '''
 
 RETURN = '''
@@ -192,43 +255,405 @@ sample: {
 
 '''
 
-from ansible.module_utils.basic import AnsibleModule
-from cvpysdk.commcell import Commcell
-from cvpysdk.job import Job
+import hashlib
+import json
+import os
+import threading
+import time
 
+from dataclasses import dataclass
+from functools import lru_cache
 
-commcell = client = clients = agent = agents = instance = instances = backupset = backupsets = subclient = subclients = None
+from ansible.module_utils.basic import AnsibleModule
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        """To serialize obj to a JSON string via orjson"""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj):
+        """To serialize obj to a compact JSON string via the stdlib"""
+        return json.dumps(obj, separators=(',', ':'))
+
+
+@dataclass(slots=True)
+class CVContext:
+    """Container for the CVPySDK objects resolved for one entity"""
+
+    commcell: object = None
+    client: object = None
+    clients: object = None
+    clientgroup: object = None
+    clientgroups: object = None
+    agent: object = None
+    agents: object = None
+    instance: object = None
+    instances: object = None
+    backupset: object = None
+    backupsets: object = None
+    subclient: object = None
+    subclients: object = None
+    job: object = None
+    jobs: object = None
 
-job = jobs = None
 
 result = {}
 
+_BUILTIN_RESULT_TYPES = (str, int, float, bool, list, dict, tuple, bytes, type(None))
 
-def login(module):
+_LOGIN_ARGSPEC = {
+    'webconsole_hostname': {'required': True},
+    'commcell_username': {},
+    'commcell_password': {'no_log': True},
+    'authtoken': {'no_log': True}
+}
+
+_COMMCELL_ARGSPEC = {
+    'webconsole_hostname': {'required': True},
+    'commcell_username': {},
+    'commcell_password': {'no_log': True},
+    'authtoken': {'no_log': True}
+}
+
+
+def _validate_subspec(module, values, argspec, name):
     """
-    sign in the user to the commcell with the credentials provided
+    To validate only the nested arguments relevant to the chosen operation
+
+    Keys marked no_log in the spec have their values registered for
+    masking in the module output.
+
+    Args:
+        module  (object)    -- instance of the AnsibleModule class
+
+        values  (dict)      -- the nested parameter dict to validate
+
+        argspec (dict)      -- argument spec describing the expected keys
+
+        name    (str)       -- name of the parameter, used in the error message
+
+    """
+    missing = [key for key, spec in argspec.items() if spec.get('required') and not values.get(key)]
+
+    if missing:
+        module.fail_json(msg='missing required arguments in {0}: {1}'.format(name, ', '.join(missing)))
+
+    for key, spec in argspec.items():
+        if spec.get('no_log') and values.get(key):
+            module.no_log_values.add(values[key])
+
+
+def _validate_credentials(module, values, name):
+    """
+    To check that the given dict carries a usable form of authentication
+
+    Args:
+        module  (object)    -- instance of the AnsibleModule class
+
+        values  (dict)      -- the nested parameter dict to validate
+
+        name    (str)       -- name of the parameter, used in the error message
+
+    """
+    if not (values.get('authtoken') or (values.get('commcell_username') and values.get('commcell_password'))):
+        module.fail_json(
+            msg='{0} requires either authtoken or commcell_username and commcell_password'.format(name)
+        )
+
+_COMMCELL_CACHE = {}
+
+_COMMCELL_CACHE_LOCK = threading.Lock()
+
+TOKEN_CACHE_TTL = 8 * 60 * 60
+
+_SDK_EXCEPTION = None
+
+
+def _sdk_exception():
+    """
+    To get the cvpysdk SDKException class, importing it only on first use
+
+    Returns:
+        type    -   the SDKException class
+
+    """
+    global _SDK_EXCEPTION
+
+    if _SDK_EXCEPTION is None:
+        from cvpysdk.exception import SDKException
+        _SDK_EXCEPTION = SDKException
+
+    return _SDK_EXCEPTION
+
+
+def _session_file(webconsole_hostname, commcell_username):
+    """
+    To get the path of the token cache file for the given webconsole and user
+
+    Args:
+        webconsole_hostname (str)   -- hostname of the webconsole
+
+        commcell_username   (str)   -- user the token belongs to
+
+    Returns:
+        str     -   path of the per-webconsole, per-user token cache file
+
+    """
+    cache_dir = os.environ.get('XDG_RUNTIME_DIR') or os.path.join(os.path.expanduser('~'), '.ansible', 'tmp')
+    key = '{0}\n{1}'.format(webconsole_hostname, commcell_username)
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, 'commvault_{0}.json'.format(digest))
+
+
+def _read_session_file(webconsole_hostname, commcell_username):
+    """
+    To read the persisted authtoken for the given webconsole and user, if any
+
+    Args:
+        webconsole_hostname (str)   -- hostname of the webconsole
+
+        commcell_username   (str)   -- user requesting the token
+
+    Returns:
+        str     -   the persisted, non-expired authtoken of that user, or None
+
+    """
+    try:
+        with open(_session_file(webconsole_hostname, commcell_username)) as session_file:
+            session = json.load(session_file)
+
+        if (session.get('webconsole_hostname') == webconsole_hostname
+                and session.get('commcell_username') == commcell_username
+                and session.get('expires_at', 0) > time.time()):
+            return session.get('authtoken')
+    except (IOError, OSError, ValueError):
+        pass
+
+    return None
+
+
+def _write_session_file(webconsole_hostname, commcell_username, authtoken):
+    """
+    To persist the authtoken for the given webconsole and user across module invocations
+
+    The file is created with mode 0600 so the token is only readable by
+    the invoking user.
+
+    Args:
+        webconsole_hostname (str)   -- hostname of the webconsole
+
+        commcell_username   (str)   -- user the token belongs to
+
+        authtoken           (str)   -- authtoken of the authenticated session
+
+    """
+    try:
+        path = _session_file(webconsole_hostname, commcell_username)
+        session_dir = os.path.dirname(path)
+
+        if not os.path.isdir(session_dir):
+            os.makedirs(session_dir)
+
+        session = {
+            'webconsole_hostname': webconsole_hostname,
+            'commcell_username': commcell_username,
+            'authtoken': authtoken,
+            'expires_at': time.time() + TOKEN_CACHE_TTL
+        }
+
+        fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+
+        with os.fdopen(fd, 'w') as session_file:
+            json.dump(session, session_file)
+    except (IOError, OSError):
+        pass
+
+
+def _mount_pooled_adapter(commcell_object):
+    """
+    To install a pooled keep-alive HTTP adapter on the commcell's requests session
+
+    Every REST call otherwise pays a fresh TCP and TLS handshake; pooling
+    reuses the connection across SDK calls.
+
+    Args:
+        commcell_object (object)    -- instance of the Commcell class
+
+    """
+    try:
+        from requests.adapters import HTTPAdapter
+        from requests.packages.urllib3.util.retry import Retry
+    except ImportError:
+        return
+
+    session = None
+
+    for owner in (commcell_object, getattr(commcell_object, '_cvpysdk_object', None)):
+        if owner is not None:
+            session = getattr(owner, '_requests_session', None) or getattr(owner, '_session', None)
+
+        if session is not None:
+            break
+
+    if session is None:
+        return
+
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+def _get_commcell(webconsole_hostname, authtoken):
+    """
+    To get an authenticated Commcell object, reusing a cached session when available
+
+    Args:
+        webconsole_hostname (str)   -- hostname of the webconsole
+
+        authtoken           (str)   -- authtoken of an authenticated session
+
+    Returns:
+        object  -   instance of the Commcell class
+
+    """
+    key = (webconsole_hostname, authtoken)
+
+    with _COMMCELL_CACHE_LOCK:
+        cached = _COMMCELL_CACHE.get(key)
+
+    if cached is not None:
+        try:
+            # cheap probe to make sure the cached session is still alive
+            cached.commserv_version
+            return cached
+        except Exception:
+            with _COMMCELL_CACHE_LOCK:
+                _COMMCELL_CACHE.pop(key, None)
+
+    from cvpysdk.commcell import Commcell
+
+    commcell_object = Commcell(webconsole_hostname, authtoken=authtoken)
+    _mount_pooled_adapter(commcell_object)
+
+    with _COMMCELL_CACHE_LOCK:
+        _COMMCELL_CACHE[key] = commcell_object
+
+    return commcell_object
+
+
+def _login_with_credentials(module):
+    """
+    sign in to the commcell with the username and password provided
 
     Args:
         module (dict)   -- webconsole and authentication details
 
+    Returns:
+        object  -   instance of the Commcell class
+
+    """
+    from cvpysdk.commcell import Commcell
+
+    commcell_object = Commcell(
+        webconsole_hostname=module['webconsole_hostname'],
+        commcell_username=module['commcell_username'],
+        commcell_password=module['commcell_password']
+    )
+    _mount_pooled_adapter(commcell_object)
+
+    with _COMMCELL_CACHE_LOCK:
+        _COMMCELL_CACHE[(commcell_object.webconsole_hostname, commcell_object.auth_token)] = commcell_object
+
+    return commcell_object
+
+
+def login(module, token_cache=True):
+    """
+    sign in the user to the commcell with the credentials provided
+
+    Args:
+        module      (dict)  -- webconsole and authentication details
+
+        token_cache (bool)  -- whether to reuse and persist the on-disk authtoken cache
+
     """
     global commcell_object
 
-    if module.get('authtoken'):
-        commcell_object = Commcell(module['webconsole_hostname'], authtoken=module['authtoken'])
+    authtoken = module.get('authtoken')
 
+    if authtoken:
+        commcell_object = _get_commcell(module['webconsole_hostname'], authtoken)
     else:
-        commcell_object = Commcell(
-            webconsole_hostname=module['webconsole_hostname'],
-            commcell_username=module['commcell_username'],
-            commcell_password=module['commcell_password']
-        )
+        # only reuse a cached token that was issued to the requesting user
+        username = module.get('commcell_username')
+        cached_token = _read_session_file(module['webconsole_hostname'], username) if token_cache and username else None
+
+        if cached_token:
+            try:
+                commcell_object = _get_commcell(module['webconsole_hostname'], cached_token)
+            except _sdk_exception():
+                # cached token no longer valid; retry once with a fresh login
+                commcell_object = _login_with_credentials(module)
+        else:
+            commcell_object = _login_with_credentials(module)
+
+        if token_cache and username:
+            _write_session_file(commcell_object.webconsole_hostname, username, commcell_object.auth_token)
+
+
+_ENTITY_CACHE = {}
+
+_REGISTRY = {}
+
+
+@lru_cache(maxsize=256)
+def _cached_get(collection_id, name):
+    """
+    To get a named entity from a registered CVPySDK collection, memoized
+
+    Args:
+        collection_id   (int)   -- id() of the collection in _REGISTRY
+
+        name            (str)   -- name of the entity to look up
+
+    Returns:
+        object  -   the entity returned by the collection's get()
+
+    """
+    return _REGISTRY[collection_id].get(name)
+
+
+def _get(collection, name):
+    """
+    To look up a named entity on a collection through the memoizing cache
+
+    Args:
+        collection  (object)    -- a CVPySDK collection, e.g. Clients or Subclients
+
+        name        (str)       -- name of the entity to look up
+
+    Returns:
+        object  -   the entity returned by the collection's get()
+
+    """
+    _REGISTRY[id(collection)] = collection
+    return _cached_get(id(collection), name)
 
 
 def create_object(entity):
     """
     To create the basic commvault objects
 
+    Resolved objects are cached per commcell and entity, so repeated
+    invocations against the same entity skip the REST-backed lookups.
+
     entity  (dict)  -- basic commvault object names
 
         Example:
@@ -240,41 +665,198 @@ def create_object(entity):
                 subclient: ""
             }
 
+    Returns:
+        object  -   instance of the CVContext class with the resolved objects
+
     """
-    global commcell, client, clients, agent, agents, instance, instances, backupset, backupsets, subclient, subclients, result, clientgroup, clientgroups
+    key = (id(commcell_object), frozenset(entity.items()))
+    cached = _ENTITY_CACHE.get(key)
+
+    if cached is not None:
+        return cached
+
+    ctx = CVContext(commcell=commcell_object, clients=commcell_object.clients)
 
-    commcell = commcell_object
-    clients = commcell_object.clients
-    
     if 'client' in entity:
 
-        client = clients.get(entity['client'])
-        agents = client.agents
+        ctx.client = _get(ctx.clients, entity['client'])
+        ctx.agents = ctx.client.agents
 
         if 'agent' in entity:
-            agent = agents.get(entity['agent'])
-            instances = agent.instances
-            backupsets = agent.backupsets
+            ctx.agent = _get(ctx.agents, entity['agent'])
+            ctx.instances = ctx.agent.instances
+            ctx.backupsets = ctx.agent.backupsets
 
             if 'instance' in entity:
-                instance = instances.get(entity['instance'])
+                ctx.instance = _get(ctx.instances, entity['instance'])
 
             if 'backupset' in entity:
-                backupset = backupsets.get(entity['backupset'])
-                subclients = backupset.subclients
+                ctx.backupset = _get(ctx.backupsets, entity['backupset'])
+                ctx.subclients = ctx.backupset.subclients
 
                 if 'subclient' in entity:
-                    subclient = subclients.get(entity['subclient'])
+                    ctx.subclient = _get(ctx.subclients, entity['subclient'])
 
     if 'job_id' in entity:
-        global job, jobs
-
-        jobs = commcell_object.job_controller
-        job = jobs.get(entity['job_id'])
+        ctx.jobs = commcell_object.job_controller
+        ctx.job = ctx.jobs.get(entity['job_id'])
 
     if 'clientgroup' in entity:
-        clientgroups = commcell_object.client_groups
-        clientgroup = clientgroups.get(entity['clientgroup'])
+        ctx.clientgroups = commcell_object.client_groups
+        ctx.clientgroup = ctx.clientgroups.get(entity['clientgroup'])
+
+    _ENTITY_CACHE[key] = ctx
+    return ctx
+
+
+def _wait_for_completion(job_object, args):
+    """
+    To wait for a job to finish, polling with exponential backoff
+
+    Starts with a short interval so short jobs return almost immediately,
+    and backs off to a cap so long jobs do not flood the WebConsole.
+
+    Args:
+        job_object  (object)    -- instance of the Job class
+
+        args        (dict)      -- may contain poll_interval_min and
+        poll_interval_max overrides in seconds, and timeout in minutes
+        as accepted by the SDK's wait_for_completion; any other keys are
+        forwarded to the SDK call
+
+    Returns:
+        bool    -   boolean specifying whether the job finished successfully,
+        False if the timeout expired first
+
+    """
+    interval = float(args.get('poll_interval_min', 0.25))
+    cap = float(args.get('poll_interval_max', 10.0))
+    timeout = args.get('timeout')
+    deadline = time.time() + float(timeout) * 60 if timeout else None
+
+    while not job_object.is_finished:
+        if deadline is not None and time.time() >= deadline:
+            return False
+
+        time.sleep(interval)
+        interval = min(interval * 1.5, cap)
+
+    sdk_args = {
+        key: value for key, value in args.items()
+        if key not in ('poll_interval_min', 'poll_interval_max', 'timeout')
+    }
+
+    # the job is already finished, so this returns without the SDK's own polling
+    return job_object.wait_for_completion(**sdk_args)
+
+
+_ENTITY_TYPES = (
+    'commcell', 'client', 'clients', 'clientgroup', 'clientgroups', 'agent', 'agents',
+    'instance', 'instances', 'backupset', 'backupsets', 'subclient', 'subclients', 'job', 'jobs'
+)
+
+# maps both the lowercase and the capitalized spellings from the docs, so the
+# common case needs no str.lower() at dispatch time
+_ENTITY_TYPE_CANON = {}
+
+for _entity_type in _ENTITY_TYPES:
+    _ENTITY_TYPE_CANON[_entity_type] = _entity_type
+    _ENTITY_TYPE_CANON[_entity_type.capitalize()] = _entity_type
+
+_SINGULAR_TO_PLURAL = {
+    'commcell': 'commcell',
+    'client': 'clients',
+    'clientgroup': 'clientgroups',
+    'agent': 'agents',
+    'instance': 'instances',
+    'backupset': 'backupsets',
+    'subclient': 'subclients',
+    'job': 'jobs'
+}
+
+_METHODS_CACHE = {}
+
+
+def _methods(obj):
+    """
+    To get the public attribute names of obj's class, cached per class
+
+    Unlike hasattr, this never triggers __getattr__ or lazy properties,
+    some of which perform REST calls in CVPySDK classes.
+
+    Args:
+        obj (object)    -- instance of a CVPySDK class
+
+    Returns:
+        frozenset   -   public attribute names defined on the class
+
+    """
+    cls = type(obj)
+    methods = _METHODS_CACHE.get(cls)
+
+    if methods is None:
+        methods = frozenset(name for name in dir(cls) if not name.startswith('_'))
+        _METHODS_CACHE[cls] = methods
+
+    return methods
+
+
+def execute(ctx, operation, entity_type, args):
+    """
+    To execute a single CVPySDK operation against the objects resolved by create_object
+
+    Args:
+        ctx         (object)    -- instance of the CVContext class
+
+        operation   (str)       -- method or property name on the CVPySDK class
+
+        entity_type (str)       -- CVPySDK class the operation belongs to
+
+        args        (dict)      -- arguments to be passed to the CVPySDK method
+
+    Returns:
+        the output of the operation
+
+    """
+    entity_type = _ENTITY_TYPE_CANON.get(entity_type) or _ENTITY_TYPE_CANON[entity_type.lower()]
+
+    if operation == 'wait_for_completion' and entity_type == 'job':
+        return _wait_for_completion(ctx.job, args)
+
+    obj = getattr(ctx, entity_type)
+
+    if operation not in _methods(obj):
+        obj = getattr(ctx, _SINGULAR_TO_PLURAL[entity_type])
+
+    attr = getattr(obj, operation)
+
+    if callable(attr):
+        if args:
+            output = attr(**args)
+        else:
+            output = attr()
+
+    else:
+        if args:
+            setattr(obj, operation, next(iter(args.values())))
+            return "Property set successfully"
+
+        output = attr
+
+    if isinstance(output, _BUILTIN_RESULT_TYPES):
+        return output
+
+    from cvpysdk.job import Job
+
+    if isinstance(output, Job):
+        return output.job_id
+
+    properties = getattr(output, '_properties', None)
+
+    if isinstance(properties, dict):
+        return _dumps(properties)
+
+    return str(output)
 
 
 def main():
@@ -284,7 +866,10 @@ def main():
         entity=dict(type="dict", default={}),
         entity_type=dict(type='str', default=''),
         commcell=dict(type='dict', default={}),
-        args=dict(type='dict', default={})
+        args=dict(type='dict', default={}),
+        operations=dict(type='list', elements='dict', default=[]),
+        concurrency=dict(type='int', default=1),
+        token_cache=dict(type='bool', default=True)
     )
 
     module = AnsibleModule(
@@ -295,48 +880,63 @@ def main():
     global result
     result = dict()
     if module.params['operation'].lower() == 'login':
-        login(module.params['entity'])
+        entity = module.params['entity']
+        _validate_subspec(module, entity, _LOGIN_ARGSPEC, 'entity')
+        _validate_credentials(module, entity, 'entity')
+
+        try:
+            login(entity, token_cache=module.params['token_cache'])
+        except _sdk_exception() as sdk_exception:
+            module.fail_json(msg=str(sdk_exception), **result)
+
         result['changed'] = True
         result['authtoken'] = commcell_object.auth_token
         result['webconsole_hostname'] = commcell_object.webconsole_hostname
     else:
-        login(module.params['commcell'])
-        create_object(module.params['entity'])
-        # module.exit_json(**module.params['entity'])
-
-        obj_name = module.params["entity_type"]
-        obj = eval(obj_name)
-        method = module.params["operation"]
-
-        if not hasattr(obj, method):
-            obj_name = '{}s'.format(module.params["entity_type"])
-            obj = eval(obj_name)
+        _validate_subspec(module, module.params['commcell'], _COMMCELL_ARGSPEC, 'commcell')
+        _validate_credentials(module, module.params['commcell'], 'commcell')
 
-        statement = '{0}.{1}'.format(obj_name, method)
-        attr = getattr(obj, method)
-
-        if callable(attr):
-            if module.params.get('args'):
-                args = module.params["args"]
-                statement = '{0}(**{1})'.format(statement, args)
-            else:
-                statement = '{0}()'.format(statement)
+        try:
+            login(module.params['commcell'], token_cache=module.params['token_cache'])
+        except _sdk_exception() as sdk_exception:
+            module.fail_json(msg=str(sdk_exception), **result)
+        # module.exit_json(**module.params['entity'])
 
+        if module.params['operations']:
+
+            def run_operation(operation):
+                ctx = create_object(operation.get('entity') or module.params['entity'])
+                return execute(
+                    ctx,
+                    operation['operation'],
+                    operation.get('entity_type') or module.params['entity_type'],
+                    operation.get('args') or {}
+                )
+
+            try:
+                if module.params['concurrency'] > 1:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    with ThreadPoolExecutor(max_workers=module.params['concurrency']) as executor:
+                        outputs = list(executor.map(run_operation, module.params['operations']))
+                else:
+                    outputs = [run_operation(operation) for operation in module.params['operations']]
+            except _sdk_exception() as sdk_exception:
+                module.fail_json(msg='operations: {0}'.format(sdk_exception), **result)
+
+            result['outputs'] = outputs
         else:
-            if module.params.get('args'):
-                statement = '{0} = list(module.params["args"].values())[0]'.format(statement)
-                exec(statement)
-                result['output'] = "Property set successfully"
-                module.exit_json(**result)
-
-        output = eval(statement)
-
-        if type(output).__module__ in ['builtins', '__builtin__']:
-            result['output'] = output
-        elif isinstance(output, Job):
-            result['output'] = output.job_id
-        else:
-            result['output'] = str(output)
+            try:
+                ctx = create_object(module.params['entity'])
+                result['output'] = execute(
+                    ctx, module.params['operation'], module.params['entity_type'], module.params['args']
+                )
+            except _sdk_exception() as sdk_exception:
+                # built only on the error path, the happy path carries no statement string
+                detail = '{0}.{1}({2})'.format(
+                    module.params['entity_type'], module.params['operation'], module.params['args'] or ''
+                )
+                module.fail_json(msg='{0}: {1}'.format(detail, sdk_exception), **result)
 
     module.exit_json(**result)
 